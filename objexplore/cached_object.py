@@ -1,10 +1,19 @@
 import importlib
 import inspect
 import pkgutil
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import reprlib
+import types
+from collections.abc import Mapping, Sequence, Set
+from functools import cached_property, lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from typing import Sequence as SequenceType
+from typing import Tuple, Union
 
 from rich.console import Console
 from rich.highlighter import ReprHighlighter
+from rich.layout import Layout
+from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.style import Style
 from rich.syntax import Syntax
@@ -18,8 +27,135 @@ highlighter = ReprHighlighter()
 PUBLIC = "PUBLIC"
 PRIVATE = "PRIVATE"
 
+MAPPING = "MAPPING"
+SEQUENCE = "SEQUENCE"
+
 console = Console()
 
+# Styles and separators shared by every CachedObject. Adding `Text` objects copies them,
+# so these can be concatenated as is but must be copied before being modified
+_STYLE_WHITE = Style(color="white")
+_STYLE_CYAN = Style(color="cyan")
+_STYLE_BLUE = Style(color="blue")
+_STYLE_DIM = Style(dim=True)
+_STYLE_DIM_WHITE = _STYLE_WHITE + _STYLE_DIM
+_DOT = Text(".", style=_STYLE_WHITE)
+_LBRACK = Text("[", style=_STYLE_WHITE)
+_RBRACK = Text("]", style=_STYLE_WHITE)
+_SPACE = Text(" ")
+
+_TYPE_TITLE = "[i][cyan]type[/cyan]()[/i]"
+_LEN_TITLE = "[i][cyan]len[/cyan]()[/i]"
+
+
+class _ShortRepr(reprlib.Repr):
+    """`reprlib.Repr` sorts dicts and sets, keep them in iteration order like `repr()`
+    and the `Pretty` value preview"""
+
+    # `Repr.fillvalue` only exists from Python 3.11, older versions hardcode "..."
+    _fill = "..."
+
+    def repr_dict(self, x, level):
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{" + self._fill + "}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append(self._fill)
+        return "{" + ", ".join(pieces) + "}"
+
+    def repr_set(self, x, level):
+        if not x:
+            return "set()"
+        return self._repr_iterable(x, level, "{", "}", self.maxset)
+
+    def repr_frozenset(self, x, level):
+        if not x:
+            return "frozenset()"
+        return self._repr_iterable(x, level, "frozenset({", "})", self.maxfrozenset)
+
+
+# The one line `repr()` only has to fill the width of the terminal, so bound the amount of
+# work done for huge strings and containers instead of highlighting their full repr
+_short_repr = _ShortRepr()
+_short_repr.maxstring = 200
+_short_repr.maxother = 200
+_short_repr.maxlong = 200
+_short_repr.maxlist = 10
+_short_repr.maxtuple = 10
+_short_repr.maxset = 10
+_short_repr.maxfrozenset = 10
+_short_repr.maxdeque = 10
+_short_repr.maxdict = 10
+_short_repr.maxarray = 10
+
+# Filtering a sequence builds an entry for every item it checks. Items of a `range` are
+# computed rather than stored, so it can be arbitrarily long (e.g. `range(10**9)`) and
+# only its first items are filtered. The rest count as hidden
+_MAX_FILTERED_ITEMS = 10_000
+
+# Dictionary key types whose `str()` is rendered like a literal
+_STR_KEY_REPR_TYPES = frozenset({int, float, bool, type(None)})
+
+# The lazily computed views of the object shown in the overview, see `refresh`
+_OVERVIEW_PROPERTIES = (
+    "length",
+    "_source",
+    "typeof",
+    "docstring",
+    "repr",
+    "pretty",
+    "_pretty_by_max_length",
+    "info_layout",
+)
+
+# Highlighted `str(type(...))` of dict values and list items, keyed by the type
+_type_text_cache: Dict[type, Text] = {}
+
+
+def _type_text(obj: Any) -> Text:
+    """Return the highlighted type of the object. The result is shared, copy it before
+    modifying it"""
+    obj_type = type(obj)
+    type_text = _type_text_cache.get(obj_type)
+    if type_text is None:
+        type_text = _type_text_cache[obj_type] = highlighter(str(obj_type))
+    return type_text
+
+
+@lru_cache(maxsize=4096)
+def _render_docstring(doc: Optional[str]) -> Text:
+    """Clean and render a raw docstring. Many attributes share the same docstring (e.g.
+    methods inherited from `object`), so the result is cached on the docstring itself"""
+    return console.render_str(inspect.cleandoc(doc) if doc else "None")
+
+
+def _head_end(text: str, num_lines: int) -> int:
+    """ Return the offset at which the first `num_lines` lines of the text end """
+    end = -1
+    for _ in range(num_lines):
+        end = text.find("\n", end + 1)
+        if end < 0:
+            return len(text)
+    return max(end, 0)
+
+
+def get_container_kind(obj: Any) -> Optional[str]:
+    """Return whether the object should be explored by its keys (MAPPING), by its items
+    (SEQUENCE) or by its attributes (None)"""
+    if isinstance(obj, Mapping):
+        return MAPPING
+    # Strings and byte buffers are sequences but are explored like any other object
+    if isinstance(obj, (Sequence, Set)) and not isinstance(
+        obj, (str, bytes, bytearray, memoryview)
+    ):
+        return SEQUENCE
+    return None
+
 
 def safegetattr(obj, attr):
     try:
@@ -28,7 +164,114 @@ def safegetattr(obj, attr):
         return None
 
 
+def _match_all(cached_obj: "CachedObject") -> bool:
+    return True
+
+
+class _AttrDict(Dict[str, "CachedObject"]):
+    """Dictionary of attribute name -> CachedObject that only builds each CachedObject
+    the first time it is looked up"""
+
+    __slots__ = ("_parent", "_values")
+
+    def __init__(self, parent: "CachedObject"):
+        super().__init__()
+        self._parent = parent
+        # Raw attribute values fetched by `fetch` that have no CachedObject yet
+        self._values: Dict[str, Any] = {}
+
+    def fetch(self, attrs: List[str]) -> List[str]:
+        """Look up the values of the given attributes of the parent object and return
+        the attributes that could be looked up. Attributes that raise are skipped"""
+        obj = self._parent.obj
+        # Look up each attribute once, properties and other descriptors may be costly
+        # or have side effects
+        found = []
+        for attr in attrs:
+            try:
+                self._values[attr] = getattr(obj, attr)
+            except Exception:
+                continue
+            found.append(attr)
+        return found
+
+    def __missing__(self, key: str) -> "CachedObject":
+        try:
+            obj = self._values.pop(key)
+        except KeyError:
+            obj = safegetattr(self._parent.obj, key)
+        val = CachedObject(obj, parent_path=self._parent.dotpath, attr_name=key)
+        self[key] = val
+        return val
+
+
+class _WindowedList(Sequence):
+    """Sequence of (line, CachedObject) entries for the items of a list/tuple/set. The
+    explorer only displays a window of the items at a time, so each entry is only built
+    the first time it is indexed"""
+
+    __slots__ = ("_parent", "_items", "_entries")
+
+    def __init__(self, parent: "CachedObject", items: SequenceType[Any]):
+        self._parent = parent
+        self._items = items
+        self._entries: Dict[int, Tuple[Text, "CachedObject"]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        entry = self._entries.get(index)
+        if entry is None:
+            entry = self._entries[index] = self._parent._build_list_entry(
+                index, self._items[index]
+            )
+        return entry
+
+
 class CachedObject:
+    # One CachedObject exists per explored attribute/item, so keep the eagerly set
+    # attributes in slots. `__dict__` is still needed to store the cached_property values
+    __slots__ = (
+        "__dict__",
+        "obj",
+        "attr_name",
+        "dotpath",
+        "hidden",
+        "plain_attrs",
+        "plain_public_attributes",
+        "plain_private_attributes",
+        "public_attributes",
+        "private_attributes",
+        "_fetched_attributes",
+        "num_public_attributes",
+        "num_private_attributes",
+        "filters",
+        "search_filter",
+        "_matches_filters",
+        "filtered_public_attributes",
+        "filtered_private_attributes",
+        "num_filtered_public_attributes",
+        "num_filtered_private_attributes",
+        "container_kind",
+        "_all_dict_entries",
+        "_all_list_entries",
+        "filtered_dict",
+        "filtered_list",
+        "num_filtered_dict_keys",
+        "num_filtered_list_items",
+        "_docstring_head",
+        "version",
+    )
+
     def __init__(
         self,
         obj: Any,
@@ -38,7 +281,6 @@ class CachedObject:
         hidden: bool = False,
     ):
         self.obj = obj
-        self.is_callable = callable(obj)
         self.attr_name = attr_name if attr_name else repr(self.obj)
 
         if self.obj is None:
@@ -46,12 +288,11 @@ class CachedObject:
 
         elif attr_name is not None:
             if not parent_path:
-                self.dotpath = Text(attr_name, style=Style(color="cyan"))
+                self.dotpath = Text(attr_name, style=_STYLE_CYAN)
             else:
-                self.dotpath = (
-                    parent_path
-                    + Text(".", style=Style(color="white"))
-                    + Text(attr_name, style=Style(color="cyan"))
+                # Assemble in one pass, every `+` would copy the whole parent path
+                self.dotpath = Text.assemble(
+                    parent_path, _DOT, (attr_name, _STYLE_CYAN)
                 )
 
         elif index is not None:
@@ -60,18 +301,9 @@ class CachedObject:
             else:
                 repr_index = console.render_str(str(index))
             if not parent_path:
-                self.dotpath = (
-                    Text("[", style=Style(color="white"))
-                    + repr_index
-                    + Text("]", style=Style(color="white"))
-                )
+                self.dotpath = Text.assemble(_LBRACK, repr_index, _RBRACK)
             else:
-                self.dotpath = (
-                    parent_path
-                    + Text("[", style=Style(color="white"))
-                    + repr_index
-                    + Text("]", style=Style(color="white"))
-                )
+                self.dotpath = Text.assemble(parent_path, _LBRACK, repr_index, _RBRACK)
         else:
             raise ValueError("Need to specify an attribute name or an index")
 
@@ -81,124 +313,243 @@ class CachedObject:
             # Ignore weakrefs
             self.plain_attrs.remove("__weakref__")
 
-        self.plain_public_attributes = sorted(
-            attr for attr in self.plain_attrs if not attr.startswith("_")
-        )
-        self.plain_private_attributes = sorted(
-            attr for attr in self.plain_attrs if attr.startswith("_")
-        )
+        # `dir()` already returns a sorted list so the split lists stay sorted
+        self.plain_public_attributes: List[str] = []
+        self.plain_private_attributes: List[str] = []
+        for attr in self.plain_attrs:
+            if attr.startswith("_"):
+                self.plain_private_attributes.append(attr)
+            else:
+                self.plain_public_attributes.append(attr)
 
-        self.public_attributes: Dict[str, CachedObject] = {}
-        self.private_attributes: Dict[str, CachedObject] = {}
-        self.filtered_public_attributes: Dict[str, CachedObject] = {}
-        self.filtered_private_attributes: Dict[str, CachedObject] = {}
+        # Children are built on demand, `plain_*_attributes` are the attribute names to list
+        self.public_attributes = _AttrDict(self)
+        self.private_attributes = _AttrDict(self)
+        self._fetched_attributes = False
+        self.filtered_public_attributes: List[str] = []
+        self.filtered_private_attributes: List[str] = []
 
-        try:
-            self._source = inspect.getsource(self.obj)  # type: ignore
-        except Exception:
-            self._source = ""
+        self.filters: List[Union[bool, Callable[[Any], Any]]] = []
+        self._matches_filters: Callable[[CachedObject], bool] = _match_all
+        self.search_filter: str = ""
+
+        self.container_kind = get_container_kind(self.obj)
+
+        # Every (line, cached object) entry of a dict/list/tuple/set, built once by
+        # `_build_container_views` and then narrowed down by `_apply_filters`
+        self._all_dict_entries: Optional[Dict[Any, Tuple[Text, CachedObject]]] = None
+        self._all_list_entries: Optional[_WindowedList] = None
+
+        self.hidden = hidden
 
-        self.length: Optional[int]
+        # The (term_height, Text) last returned by `get_docstring`
+        self._docstring_head: Optional[Tuple[int, Text]] = None
+        # Bumped by `refresh`, lets the overview know its cached panels are stale
+        self.version = 0
 
+    # Everything below is only needed once the object is actually displayed, so it is
+    # computed lazily rather than for every attribute found by `cache()`
+
+    @cached_property
+    def length(self) -> Optional[int]:
         try:
-            self.length = len(self.obj)  # type: ignore
+            return len(self.obj)  # type: ignore
         except TypeError:
-            self.length = None
+            return None
 
-        self.isbuiltin: bool = inspect.isbuiltin(self.obj)
-        self.isclass: bool = inspect.isclass(self.obj)
-        self.isfunction: bool = inspect.isfunction(self.obj)
-        self.ismethod: bool = inspect.ismethod(self.obj)
-        self.ismethoddescriptor: bool = inspect.ismethoddescriptor(self.obj)
-        self.ismodule: bool = inspect.ismodule(self.obj)
+    # These are the same checks `inspect.is*` make, minus the extra function call
 
-        self.filters: List[Union[bool, Callable[[Any], Any]]] = []
-        self.search_filter: str = ""
+    @cached_property
+    def isbuiltin(self) -> bool:
+        return isinstance(self.obj, types.BuiltinFunctionType)
+
+    @cached_property
+    def isclass(self) -> bool:
+        return isinstance(self.obj, type)
+
+    @cached_property
+    def isfunction(self) -> bool:
+        return isinstance(self.obj, types.FunctionType)
 
-        # Highlighted attributes
-        self.typeof: Text = highlighter(str(type(self.obj)))
-        self.docstring: Text = console.render_str(inspect.getdoc(self.obj) or "None")
-        self.docstring_lines = self.docstring.split()
-        self.repr = highlighter(repr(self.obj))
-        if "\n" in self.repr:
-            self.repr = self.repr.split("\n")[0]
-        self.repr.overflow = "ellipsis"
-        self.pretty = Pretty(self.obj)
+    @cached_property
+    def ismethod(self) -> bool:
+        return isinstance(self.obj, types.MethodType)
 
-        self.text = Text(self.attr_name, style=Style(), overflow="ellipsis")
+    @cached_property
+    def ismethoddescriptor(self) -> bool:
+        return inspect.ismethoddescriptor(self.obj)
+
+    @cached_property
+    def ismodule(self) -> bool:
+        return isinstance(self.obj, types.ModuleType)
+
+    @cached_property
+    def _source(self) -> str:
+        """ Source code of the object, only read from disk the first time it is needed """
+        try:
+            return inspect.getsource(self.obj)  # type: ignore
+        except Exception:
+            # Builtins, C extensions and objects defined interactively have no source,
+            # and a source file edited since it was imported may no longer parse
+            return ""
+
+    @cached_property
+    def is_callable(self) -> bool:
+        return callable(self.obj)
+
+    @cached_property
+    def selectable(self) -> bool:
+        return is_selectable(self.obj)
+
+    # Highlighted attributes
+
+    @cached_property
+    def typeof(self) -> Text:
+        return highlighter(str(type(self.obj)))
+
+    @cached_property
+    def docstring(self) -> Text:
+        doc = safegetattr(self.obj, "__doc__")
+        if not isinstance(doc, str):
+            # Look for a docstring inherited from a parent class like `inspect.getdoc`
+            doc = inspect.getdoc(self.obj)
+        # Copy since the cached Text is shared between objects
+        return _render_docstring(doc).copy()
+
+    def get_docstring(self, term_height: int) -> Text:
+        """ Return the first `term_height` lines of the docstring """
+        if self._docstring_head is None or self._docstring_head[0] != term_height:
+            # Slice the rendered docstring once rather than splitting it into lines
+            docstring = self.docstring[: _head_end(self.docstring.plain, term_height)]
+            self._docstring_head = (term_height, docstring)
+        return self._docstring_head[1]
+
+    @cached_property
+    def repr(self) -> Text:
+        _repr = highlighter(_short_repr.repr(self.obj))
+        if "\n" in _repr:
+            _repr = _repr.split("\n")[0]
+        _repr.overflow = "ellipsis"
+        return _repr
+
+    @cached_property
+    def pretty(self) -> Pretty:
+        return Pretty(self.obj)
+
+    @cached_property
+    def _pretty_by_max_length(self) -> Dict[int, Pretty]:
+        return {}
+
+    def get_pretty(self, max_length: int) -> Pretty:
+        """ Return the pretty printed object, showing at most `max_length` container items """
+        pretty = self._pretty_by_max_length.get(max_length)
+        if pretty is None:
+            pretty = self._pretty_by_max_length[max_length] = Pretty(
+                self.obj, max_length=max_length
+            )
+        return pretty
+
+    @cached_property
+    def info_layout(self) -> Layout:
+        """ The overview's type() and len() panels, which only depend on the object """
+        type_layout = Layout(
+            Panel(
+                self.typeof,
+                title=_TYPE_TITLE,
+                title_align="left",
+                style=_STYLE_WHITE,
+            ),
+            size=3,
+        )
+        if self.length is None:
+            return type_layout
+
+        layout = Layout(size=3)
+        layout.split_row(
+            Layout(type_layout),
+            Layout(
+                Panel(
+                    str(self.length),
+                    title=_LEN_TITLE,
+                    title_align="left",
+                    style=_STYLE_WHITE,
+                )
+            ),
+        )
+        return layout
+
+    @cached_property
+    def text(self) -> Text:
+        text = Text(self.attr_name, style=Style(), overflow="ellipsis")
 
         if self.ismodule:
-            self.text.style = Style(color="blue")
+            text.style = _STYLE_BLUE
         elif self.isclass:
-            self.text.style = Style(color="magenta")
+            text.style = Style(color="magenta")
         elif (
             self.isfunction
             or self.ismethod
             or self.ismethoddescriptor
-            or isinstance(self.obj, type("".capitalize))
+            or self.isbuiltin
         ):
-            self.text += Text("()", style=Style(color="white"))
-        elif type(self.obj) == dict:
-            self.text.style = Style(color="light_sea_green")
-            self.text = (
-                Text("{**", style=Style(color="white"))
-                + self.text
-                + Text("}", style=Style(color="white"))
-            )
-        elif type(self.obj) == list:
-            self.text.style = Style(color="indian_red1")
-            self.text = (
-                Text("[*", style=Style(color="white"))
-                + self.text
-                + Text("]", style=Style(color="white"))
-            )
-        elif type(self.obj) == tuple:
-            self.text.style = Style(color="pale_violet_red1")
-            self.text = (
-                Text("(*", style=Style(color="white"))
-                + self.text
-                + Text(")", style=Style(color="white"))
-            )
-        elif type(self.obj) == set:
-            self.text.style = Style(color="light_goldenrod3")
-            self.text = (
-                Text("{*", style=Style(color="white"))
-                + self.text
-                + Text("}", style=Style(color="white"))
+            text += Text("()", style=_STYLE_WHITE)
+        # Decorate containers the same way the explorer decides how to open them
+        elif self.container_kind == MAPPING:
+            text.style = Style(color="light_sea_green")
+            text = (
+                Text("{**", style=_STYLE_WHITE) + text + Text("}", style=_STYLE_WHITE)
             )
+        elif self.container_kind == SEQUENCE:
+            if isinstance(self.obj, tuple):
+                text.style = Style(color="pale_violet_red1")
+                text = (
+                    Text("(*", style=_STYLE_WHITE)
+                    + text
+                    + Text(")", style=_STYLE_WHITE)
+                )
+            elif isinstance(self.obj, Set):
+                text.style = Style(color="light_goldenrod3")
+                text = (
+                    Text("{*", style=_STYLE_WHITE)
+                    + text
+                    + Text("}", style=_STYLE_WHITE)
+                )
+            else:
+                text.style = Style(color="indian_red1")
+                text = (
+                    Text("[*", style=_STYLE_WHITE)
+                    + text
+                    + Text("]", style=_STYLE_WHITE)
+                )
 
-        if not is_selectable(self.obj):
-            self.text.style += Style(dim=True, strike=True)  # type: ignore
+        if not self.selectable:
+            text.style += Style(dim=True, strike=True)  # type: ignore
 
-        if hidden:
-            self.text.style += Style(dim=True)  # type: ignore
+        if self.hidden:
+            text.style += _STYLE_DIM  # type: ignore
+
+        return text
 
     @property
     def title(self):
         # for cases when the object is a huge dictionary we shouldnt try to render the whole dict
-        if len(self.repr.plain) > console.width - 4:
-            return Text(self.attr_name) + Text(" ") + self.typeof
+        max_width = console.width - 4
+        if len(self.repr.plain) > max_width:
+            return Text(self.attr_name) + _SPACE + self.typeof
         title = self.repr.copy()
-        title.truncate(console.width - 4)
+        title.truncate(max_width)
         return title
 
     def cache(self):
 
-        if not self.public_attributes:
-            for attr in self.plain_public_attributes:
-                self.public_attributes[attr] = CachedObject(
-                    safegetattr(self.obj, attr),
-                    parent_path=self.dotpath,
-                    attr_name=attr,
-                )
-
-        if not self.private_attributes:
-            for attr in self.plain_private_attributes:
-                self.private_attributes[attr] = CachedObject(
-                    safegetattr(self.obj, attr),
-                    parent_path=self.dotpath,
-                    attr_name=attr,
-                )
+        if not self._fetched_attributes:
+            self.plain_public_attributes = self.public_attributes.fetch(
+                self.plain_public_attributes
+            )
+            self.plain_private_attributes = self.private_attributes.fetch(
+                self.plain_private_attributes
+            )
+            self._fetched_attributes = True
 
         # Sometimes a module will have submodules that are not referenced from a call to `dir()`
         # This check will look through all submodules that are not referenced by `dir()` and add
@@ -208,7 +559,10 @@ class CachedObject:
             path = safegetattr(self.obj, "__path__")
             for importer, full_module_name, ispkg in pkgutil.iter_modules(path, prefix):
                 name = full_module_name.rsplit(".")[-1]
-                if name in self.public_attributes or name in self.private_attributes:
+                if (
+                    name in self.plain_public_attributes
+                    or name in self.plain_private_attributes
+                ):
                     continue
 
                 try:
@@ -217,16 +571,18 @@ class CachedObject:
                     continue
 
                 if not name.startswith("_"):
+                    self.plain_public_attributes.append(name)
                     self.public_attributes[name] = CachedObject(
                         module, parent_path=self.dotpath, attr_name=name, hidden=True
                     )
                 else:
+                    self.plain_private_attributes.append(name)
                     self.private_attributes[name] = CachedObject(
                         module, parent_path=self.dotpath, attr_name=name, hidden=True
                     )
 
-        self.num_public_attributes: int = len(self.public_attributes)
-        self.num_private_attributes: int = len(self.private_attributes)
+        self.num_public_attributes: int = len(self.plain_public_attributes)
+        self.num_private_attributes: int = len(self.plain_private_attributes)
 
         self.filter()
 
@@ -235,97 +591,129 @@ class CachedObject:
     ):
         self.filters = filters
         self.search_filter = search_filter.lower()
-        self.filter()
+        if filters:
+            # Only keep objects that match any of the filters
+            _filters = tuple(filters)
+            self._matches_filters = lambda cached_obj: any(
+                _filter(cached_obj) for _filter in _filters  # type: ignore
+            )
+        else:
+            self._matches_filters = _match_all
+        self._apply_filters()
 
     def filter(self):
-        self.filtered_public_attributes = {}
-        for attr, cached_obj in self.public_attributes.items():
-            if self.search_filter not in attr.lower():
-                continue
-            if not self.filters:
-                self.filtered_public_attributes[attr] = cached_obj
-            else:
-                # Only keep objects that match the filter
-                for _filter in self.filters:
-                    if _filter(cached_obj):
-                        self.filtered_public_attributes[attr] = cached_obj
-                        break
-        self.num_filtered_public_attributes = len(self.filtered_public_attributes)
+        self._apply_filters()
 
-        self.filtered_private_attributes = {}
-        for attr, cached_obj in self.private_attributes.items():
-            if self.search_filter not in attr.lower():
-                continue
-            if not self.filters:
-                self.filtered_private_attributes[attr] = cached_obj
-            else:
-                # Only keep objects that match the filter
-                for _filter in self.filters:
-                    if _filter(cached_obj):
-                        self.filtered_private_attributes[attr] = cached_obj
-                        break
-        self.num_filtered_private_attributes = len(self.filtered_private_attributes)
+    def _build_container_views(self):
+        """ Build the explorer lines for every item of a dict/list/tuple/set once """
+        if self._all_dict_entries is not None:
+            return
 
-        self.filtered_dict: Dict[str, Tuple[Text, CachedObject]] = {}
-        if type(self.obj) == dict:
+        self._all_dict_entries = {}
+        if self.container_kind == MAPPING:
             for key, val in self.obj.items():
                 repr_key: Text
                 repr_val: Text
 
                 if type(key) == str:
                     repr_key = console.render_str(f'"{key}"')
-                elif type(key) in (int, float, dict, list, set, tuple, bool, None):
+                elif type(key) in _STR_KEY_REPR_TYPES:
                     repr_key = console.render_str(str(key))
                 else:
                     repr_key = highlighter(str(key))
 
-                repr_val = highlighter(str(type(val)))
+                cached_obj = CachedObject(val, parent_path=self.dotpath, index=key)
+
+                # Copy since the style is modified below
+                repr_val = _type_text(val).copy()
 
-                if not is_selectable(val):
+                if not cached_obj.selectable:
                     repr_val.style += " dim"
                     repr_val.style = repr_val.style.strip()
 
-                line = Text(" ") + repr_key + Text(": ") + repr_val
-                line.overflow = "ellipsis"
+                # Assemble the line in one go rather than copying it with every `+`
+                line = Text.assemble(" ", repr_key, ": ", repr_val, overflow="ellipsis")
 
-                cached_obj = CachedObject(val, parent_path=self.dotpath, index=key)
+                self._all_dict_entries[key] = (line, cached_obj)
 
-                if type(key) == str and self.search_filter not in key.lower():
-                    continue
-                if self.filters:
-                    for _filter in self.filters:
-                        if _filter(cached_obj):
-                            self.filtered_dict[key] = (line, cached_obj)
-                            break
-                else:
-                    self.filtered_dict[key] = (line, cached_obj)
-        self.num_filtered_dict_keys = len(self.filtered_dict)
+        if self.container_kind == SEQUENCE:
+            # Sets can't be indexed, keep a list of their items in iteration order
+            items = self.obj if isinstance(self.obj, Sequence) else list(self.obj)
+            self._all_list_entries = _WindowedList(self, items)
+        else:
+            self._all_list_entries = _WindowedList(self, ())
+
+    def _build_list_entry(self, index: int, item: Any) -> Tuple[Text, "CachedObject"]:
+        cached_obj = CachedObject(item, parent_path=self.dotpath, index=index)
+        line = Text.assemble(
+            " [",
+            (str(index), _STYLE_BLUE),
+            "] ",
+            _type_text(item),
+            style=_STYLE_WHITE if cached_obj.selectable else _STYLE_DIM_WHITE,
+        )
+        return line, cached_obj
 
-        self.filtered_list: List[Tuple[Text, CachedObject]] = []
-        if type(self.obj) in (list, tuple, set):
-            for index, item in enumerate(self.obj):
-                line = (
-                    Text(" [", style=Style(color="white"))
-                    + Text(str(index), style=Style(color="blue"))
-                    + Text("] ", style=Style(color="white"))
-                    + highlighter(str(type(item)))
-                )
-                if not is_selectable(item):
-                    line.style += Style(dim=True)
+    def _apply_filters(self):
+        """ Narrow down the attributes and dict/list entries with the current filters """
+        self._build_container_views()
 
-                self.filtered_list.append(
-                    (line, CachedObject(item, parent_path=self.dotpath, index=index))
-                )
-            if self.filters:
-                new_filtered_list: List[Tuple[Text, CachedObject]] = []
-                for line, cached_obj in self.filtered_list:
-                    for _filter in self.filters:
-                        if _filter(cached_obj):
-                            new_filtered_list.append((line, cached_obj))
-                            break
-                self.filtered_list = new_filtered_list
+        self.filtered_public_attributes = self._filter_attributes(
+            self.plain_public_attributes, self.public_attributes
+        )
+        self.num_filtered_public_attributes = len(self.filtered_public_attributes)
+
+        self.filtered_private_attributes = self._filter_attributes(
+            self.plain_private_attributes, self.private_attributes
+        )
+        self.num_filtered_private_attributes = len(self.filtered_private_attributes)
+
+        search_filter = self.search_filter
+        matches_filters = self._matches_filters
+
+        self.filtered_dict: Dict[Any, Tuple[Text, CachedObject]] = {
+            key: entry
+            for key, entry in self._all_dict_entries.items()
+            if (type(key) != str or search_filter in key.lower())
+            and matches_filters(entry[1])
+        }
+        self.num_filtered_dict_keys = len(self.filtered_dict)
+
+        self.filtered_list: SequenceType[Tuple[Text, CachedObject]]
+        if self.filters:
+            entries: Iterable[Tuple[Text, CachedObject]] = self._all_list_entries
+            if isinstance(self.obj, range):
+                entries = islice(entries, _MAX_FILTERED_ITEMS)
+            self.filtered_list = [
+                entry for entry in entries if matches_filters(entry[1])
+            ]
+        else:
+            # Without filters every item is shown, keep building entries only when indexed
+            self.filtered_list = self._all_list_entries
         self.num_filtered_list_items = len(self.filtered_list)
 
+    def _filter_attributes(
+        self, attrs: List[str], cached_attrs: _AttrDict
+    ) -> List[str]:
+        search_filter = self.search_filter
+        if not self.filters:
+            # Don't look up the attributes, that would build every CachedObject
+            return [attr for attr in attrs if search_filter in attr.lower()]
+
+        matches_filters = self._matches_filters
+        return [
+            attr
+            for attr in attrs
+            if search_filter in attr.lower() and matches_filters(cached_attrs[attr])
+        ]
+
+    def refresh(self):
+        """ Forget the overview views of the object so they are rebuilt from its current state """
+        for name in _OVERVIEW_PROPERTIES:
+            self.__dict__.pop(name, None)
+        self._docstring_head = None
+        self.version += 1
+
     def current_visible_attributes(self):
         if self.filtered_dict:
             return self.filtered_dict
@@ -1,3 +1,5 @@
+from collections.abc import Set
+from itertools import islice
 from typing import Optional
 
 from blessed import Terminal
@@ -8,15 +10,17 @@ from rich.panel import Panel
 from rich.style import Style
 from rich.text import Text
 
-from .cached_object import CachedObject
+from .cached_object import MAPPING, SEQUENCE, CachedObject
 from .filter import Filter
 from .stack import Stack, StackFrame
-from .utils import is_selectable
 
 console = Console()
 
 highlighter = ReprHighlighter()
 
+_NL_TEXT = Text("\n")
+_STYLE_WHITE = Style(color="white")
+
 
 class ExplorerState:
     public = "ExplorerState.public"
@@ -28,15 +32,14 @@ class ExplorerState:
 
 
 def get_state(cached_obj: CachedObject):
-    _type = type(cached_obj.obj)
-    if _type == dict:
+    if cached_obj.container_kind == MAPPING:
         return ExplorerState.dict
-    elif _type == list:
+    elif cached_obj.container_kind == SEQUENCE:
+        if isinstance(cached_obj.obj, tuple):
+            return ExplorerState.tuple
+        elif isinstance(cached_obj.obj, Set):
+            return ExplorerState.set
         return ExplorerState.list
-    elif _type == tuple:
-        return ExplorerState.tuple
-    elif _type == set:
-        return ExplorerState.set
     else:
         return ExplorerState.public
 
@@ -93,6 +96,7 @@ class Explorer:
     def get_layout(self) -> Layout:
         """ Return the layout of the object explorer. This will be a list of lines representing the object attributes/keys/vals we are exploring """
         explorer_layout = Layout(size=self.layout_width)
+        text_width = self.text_width
 
         if self.state == ExplorerState.dict:
             top_panel = self.dict_panel
@@ -105,17 +109,13 @@ class Explorer:
 
         if self.filter.layout.visible:
             combined_layout = Layout()
-            combined_layout.split_column(
-                top_panel, self.filter.get_layout(self.text_width)
-            )
+            combined_layout.split_column(top_panel, self.filter.get_layout(text_width))
             explorer_layout.update(combined_layout)
         elif self.stack.layout.visible:
             combined_layout = Layout()
             combined_layout.split_column(
                 top_panel,
-                self.stack.get_layout(
-                    width=self.text_width, current_obj=self.cached_obj
-                ),
+                self.stack.get_layout(width=text_width, current_obj=self.cached_obj),
             )
             explorer_layout.update(combined_layout)
         else:
@@ -126,6 +126,8 @@ class Explorer:
     @property
     def dir_panel(self) -> Panel:
         lines = []
+        num_lines = self.num_lines
+        text_width = self.text_width
 
         if self.state == ExplorerState.public:
             # Reset the public index / window in case applying a filter has now moved the index
@@ -134,24 +136,22 @@ class Explorer:
                 self.public_index = max(
                     0, len(self.cached_obj.filtered_public_attributes) - 1
                 )
-                self.public_window = max(0, self.public_index - self.num_lines)
-
-            for index, (attr, cached_obj) in enumerate(
-                self.cached_obj.filtered_public_attributes.items()
+                self.public_window = max(0, self.public_index - num_lines)
+
+            # Only build the lines that fit in the current window, attributes are
+            # constructed on demand when they are first looked up
+            start = self.public_window
+            end = start + num_lines + 1
+            for index, attr in enumerate(
+                self.cached_obj.filtered_public_attributes[start:end], start
             ):
+                cached_obj = self.cached_obj.public_attributes[attr]
                 line = cached_obj.text.copy()
                 if index == self.public_index:
                     line.style += Style(reverse=True)  # type: ignore
 
-                # dim_typeof = cached_obj.typeof.copy()
-                # dim_typeof.style = Style(dim=True)
-                # line = (
-                #     line
-                #     + Text(" " * max(2, panel_width - (len(line) + len(cached_obj.typeof))))
-                #     + dim_typeof
-                # )
-
-                line.truncate(self.text_width)
+                # TODO add a toggle able feature to show the dimmed type of each attribute
+                line.truncate(text_width)
                 lines.append(line)
 
             title = "[i][cyan]dir[/cyan]()[/i] | [u]public[/u] [dim]private[/dim]"
@@ -162,18 +162,16 @@ class Explorer:
             )
             if (
                 len(console.render_str(subtitle_help + subtitle_index))
-                >= self.text_width - 2
+                >= text_width - 2
             ):
                 subtitle = subtitle_index
             else:
                 subtitle = subtitle_help + subtitle_index
-            if lines == []:
+            if not self.cached_obj.filtered_public_attributes:
                 lines.append(
                     Text("No public attributes", style=Style(color="red", italic=True))
                 )
 
-            lines = lines[self.public_window : self.public_window + self.num_lines + 1]
-
         elif self.state == ExplorerState.private:
             # Reset the private index / window in case applying a filter has now moved the index
             # farther down than it can access on the filtered attributes
@@ -181,25 +179,19 @@ class Explorer:
                 self.private_index = max(
                     0, len(self.cached_obj.filtered_private_attributes) - 1
                 )
-                self.private_window = max(0, self.private_index - self.num_lines)
+                self.private_window = max(0, self.private_index - num_lines)
 
-            for index, (attr, cached_obj) in enumerate(
-                self.cached_obj.filtered_private_attributes.items()
+            start = self.private_window
+            end = start + num_lines
+            for index, attr in enumerate(
+                self.cached_obj.filtered_private_attributes[start:end], start
             ):
+                cached_obj = self.cached_obj.private_attributes[attr]
                 line = cached_obj.text.copy()
                 if index == self.private_index:
                     line.style += Style(reverse=True)  # type: ignore
 
-                # TODO add a toggle able feature for this
-                # dim_typeof = cached_obj.typeof.copy()
-                # dim_typeof.style = Style(dim=True)
-                # line = (
-                #     line
-                #     + Text(" " * max(2, panel_width - (len(line) + len(cached_obj.typeof))))
-                #     + dim_typeof
-                # )
-
-                line.truncate(self.text_width)
+                line.truncate(text_width)
                 lines.append(line)
 
             title = "[i][cyan]dir[/cyan]()[/i] | [dim]public[/dim] [u]private[/u]"
@@ -208,13 +200,11 @@ class Explorer:
                 f"[white]([/white][magenta]{self.private_index + 1 if self.cached_obj.filtered_private_attributes else 0}"
                 f"[/magenta][white]/[/white][magenta]{len(self.cached_obj.filtered_private_attributes)}[/magenta][white])"
             )
-            if lines == []:
+            if not self.cached_obj.filtered_private_attributes:
                 lines.append(
                     Text("No private attributes", style=Style(color="red", italic=True))
                 )
 
-            lines = lines[self.private_window : self.private_window + self.num_lines]
-
         if self.num_hidden_attributes:
             num_filtered_line = (
                 Text(
@@ -227,15 +217,15 @@ class Explorer:
                 )
                 + Text(" filtered", style=Style(color="white", dim=True, italic=True))
             )
-            num_filtered_line.truncate(self.text_width)
+            num_filtered_line.truncate(text_width)
             lines.append(num_filtered_line)
 
-        renderable = Text("\n").join(lines)
+        renderable = _NL_TEXT.join(lines)
 
         # If terminal is too small don't show the 'dir()' part of the title
-        if self.text_width < len(console.render_str(title)) + 3:
+        if text_width < len(console.render_str(title)) + 3:
             title = title.split("|")[-1].strip()
-        if len(console.render_str(title)) > self.text_width:
+        if len(console.render_str(title)) > text_width:
             if self.state == ExplorerState.public:
                 title = "[u]public"
             elif self.state == ExplorerState.private:
@@ -247,7 +237,7 @@ class Explorer:
             title_align="right",
             subtitle=subtitle,
             subtitle_align="right",
-            style="white",
+            style=_STYLE_WHITE,
         )
 
     @property
@@ -261,6 +251,7 @@ class Explorer:
             self.dict_window = max(0, self.dict_index - self.num_lines)
 
         lines = []
+        text_width = self.text_width
 
         if self.dict_window == 0:
             lines.append(Text("{"))
@@ -276,14 +267,15 @@ class Explorer:
         end = start + num_lines
         index = start
 
-        for attr, (line, cached_obj) in list(self.cached_obj.filtered_dict.items())[
-            start:end
-        ]:
+        # Walk the dict up to the end of the window instead of copying it into a list
+        for line, cached_obj in islice(
+            self.cached_obj.filtered_dict.values(), start, end
+        ):
             new_line = line.copy()
             if index == self.dict_index:
                 new_line.style = Style(reverse=True)
 
-            new_line.truncate(self.text_width)
+            new_line.truncate(text_width)
             lines.append(new_line)
             index += 1
 
@@ -303,10 +295,10 @@ class Explorer:
                 )
                 + Text(" filtered", style=Style(color="white", dim=True, italic=True))
             )
-            num_filtered_line.truncate(self.text_width)
+            num_filtered_line.truncate(text_width)
             lines.append(num_filtered_line)
 
-        text = Text("\n").join(lines)
+        text = _NL_TEXT.join(lines)
 
         return Panel(
             text,
@@ -314,7 +306,7 @@ class Explorer:
             title_align="right",
             subtitle=f"([magenta]{self.dict_index + 1}[/magenta]/[magenta]{len(self.cached_obj.filtered_dict)}[/magenta])",
             subtitle_align="right",
-            style="white",
+            style=_STYLE_WHITE,
         )
 
     @property
@@ -326,6 +318,7 @@ class Explorer:
             self.list_window = max(0, self.list_index - self.num_lines)
 
         lines = []
+        text_width = self.text_width
 
         bracket_map = {
             ExplorerState.list: ["[", "]", "list"],
@@ -353,7 +346,7 @@ class Explorer:
             if index == self.list_index:
                 new_line.style = Style(reverse=True)
 
-            new_line.truncate(self.text_width)
+            new_line.truncate(text_width)
             lines.append(new_line)
             index += 1
 
@@ -374,10 +367,10 @@ class Explorer:
                 )
                 + Text(" filtered", style=Style(color="white", dim=True, italic=True))
             )
-            num_filtered_line.truncate(self.text_width)
+            num_filtered_line.truncate(text_width)
             lines.append(num_filtered_line)
 
-        text = Text("\n").join(lines)
+        text = _NL_TEXT.join(lines)
 
         return Panel(
             text,
@@ -385,12 +378,12 @@ class Explorer:
             title_align="right",
             subtitle=f"([magenta]{self.list_index + 1}[/magenta]/[magenta]{len(self.cached_obj.filtered_list)}[/magenta])",
             subtitle_align="right",
-            style="white",
+            style=_STYLE_WHITE,
         )
 
     def explore_selected_object(self) -> Optional[CachedObject]:
         """ TODO """
-        if not is_selectable(self.selected_object.obj):
+        if not self.selected_object.selectable:
             return self.cached_obj
 
         # Save current stack as a frame
@@ -670,20 +663,24 @@ class Explorer:
         """ Return the currently selected cached object """
         try:
             if self.state == ExplorerState.public:
-                attr = list(self.cached_obj.filtered_public_attributes.keys())[
-                    self.public_index
-                ]
-                return self.cached_obj.filtered_public_attributes[attr]
+                attr = self.cached_obj.filtered_public_attributes[self.public_index]
+                return self.cached_obj.public_attributes[attr]
 
             elif self.state == ExplorerState.private:
-                attr = list(self.cached_obj.filtered_private_attributes.keys())[
-                    self.private_index
-                ]
-                return self.cached_obj.filtered_private_attributes[attr]
+                attr = self.cached_obj.filtered_private_attributes[self.private_index]
+                return self.cached_obj.private_attributes[attr]
 
             elif self.state == ExplorerState.dict:
-                attr = list(self.cached_obj.filtered_dict)[self.dict_index]
-                return self.cached_obj.filtered_dict[attr][1]
+                # `reset_index` leaves the index at -1 when a filter hides every key
+                if self.dict_index < 0:
+                    return CachedObject(None)
+                # Walk the dict up to the index instead of copying it into a list
+                line, cached_obj = next(
+                    islice(
+                        self.cached_obj.filtered_dict.values(), self.dict_index, None
+                    )
+                )
+                return cached_obj
 
             elif self.state in (
                 ExplorerState.list,
@@ -692,14 +689,15 @@ class Explorer:
             ):
                 return self.cached_obj.filtered_list[self.list_index][1]
 
-        except (KeyError, IndexError):
+        except (KeyError, IndexError, StopIteration):
             return CachedObject(None)
 
     @property
     def layout_width(self):
-        layout_width = (self.term.width - 2) // 4 + self.extra_width
-        if layout_width > self.term.width - 20:
-            layout_width = self.term.width - 20
+        term_width = self.term.width
+        layout_width = (term_width - 2) // 4 + self.extra_width
+        if layout_width > term_width - 20:
+            layout_width = term_width - 20
             self.extra_width = 0
         return layout_width
 
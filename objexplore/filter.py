@@ -15,6 +15,9 @@ from .cached_object import CachedObject
 console = Console()
 highlighter = ReprHighlighter()
 
+_NL_TEXT = Text("\n")
+_STYLE_WHITE = Style(color="white")
+
 # TODO scroll search if input longer than panel width
 
 
@@ -87,9 +90,9 @@ class Filter:
         lines = []
         for index, (name, (enabled, method)) in enumerate(self.filters.items()):
             line = (
-                Text("[", style=Style(color="white"))
+                Text("[", style=_STYLE_WHITE)
                 + Text("X" if enabled else " ", style=Style(color="blue"))
-                + Text("] ", style=Style(color="white"))
+                + Text("] ", style=_STYLE_WHITE)
                 + Text(name, style=Style(color="magenta"))
             )
             if index == self.index:
@@ -181,7 +184,7 @@ class Filter:
         lines = self.get_lines()
         self.layout.update(
             Panel(
-                Text("\n").join(lines),
+                _NL_TEXT.join(lines),
                 title="\[filter]",
                 title_align="right",
                 subtitle=subtitle,
@@ -4,7 +4,7 @@ import pydoc
 import signal
 import subprocess
 import time
-from typing import Any, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import blessed
 import rich
@@ -44,6 +44,7 @@ class ObjExploreApp:
         self.explorer = Explorer(term=self.term, cached_obj=cached_obj)
         self.overview = Overview(term=self.term, version=version)
         self.main_style = Style(color="blue")
+        self._build_key_handlers()
 
         # Run self.draw() whenever the win change signal is caught
         try:
@@ -67,6 +68,15 @@ class ObjExploreApp:
                     self.draw()
                     key = self.term.inkey()
                     self.process_key_event(key)
+                    # Handle the keys that came in while processing (e.g. a held down
+                    # key) before drawing again, so a burst of keys costs one draw.
+                    # `inkey` buffers every byte it reads, so poll it rather than
+                    # `kbhit`, which only checks the terminal itself
+                    while True:
+                        key = self.term.inkey(timeout=0)
+                        if not key:
+                            break
+                        self.process_key_event(key)
 
                 except RuntimeError as err:
                     # Some kind of error during resizing events. Ignore and continue
@@ -159,229 +169,249 @@ class ObjExploreApp:
             self.overview.help_layout.visible = True
             return
 
-        # Stack ###############################################################
-
-        if key == "o":
-            if self.explorer.stack.layout.visible:
-                self.explorer.stack.layout.visible = False
-            elif self.explorer.filter.layout.visible:
-                self.explorer.filter.layout.visible = False
-                self.explorer.stack.set_visible()
-            else:
-                self.explorer.stack.set_visible()
-
-        elif (
-            key.code in (self.term.KEY_BACKSPACE, self.term.KEY_ESCAPE)
-            and self.explorer.stack.layout.visible
-        ):
-            self.explorer.stack.layout.visible = False
-
-        elif (
-            key == " " or key.code == self.term.KEY_ENTER
-        ) and self.explorer.stack.layout.visible:
-            self.explorer.explore_selected_stack_object()
-
-        elif (
-            key == "j" or key.code == self.term.KEY_DOWN
-        ) and self.explorer.stack.layout.visible:
-            self.explorer.stack.move_down()
-
-        elif (
-            key == "k" or key.code == self.term.KEY_UP
-        ) and self.explorer.stack.layout.visible:
-            self.explorer.stack.move_up()
-
-        elif key == "g" and self.explorer.stack.layout.visible:
-            self.explorer.stack.move_top()
+        # Stack and filter views take priority over the explorer keys
+        if self.explorer.stack.layout.visible:
+            handled = self._dispatch(
+                key, self._stack_key_handlers, self._stack_code_handlers
+            )
+        elif self.explorer.filter.layout.visible:
+            handled = self._dispatch(
+                key, self._filter_key_handlers, self._filter_code_handlers
+            )
+        else:
+            handled = False
+
+        if not handled:
+            self._dispatch(key, self._key_handlers, self._code_handlers)
+
+    @staticmethod
+    def _dispatch(
+        key: blessed.keyboard.Keystroke,
+        key_handlers: Dict[str, Callable[[], Any]],
+        code_handlers: Dict[int, Callable[[], Any]],
+    ) -> bool:
+        """ Call the handler bound to the key, return whether there was one """
+        handler = key_handlers.get(key) or code_handlers.get(key.code)
+        if handler is None:
+            return False
+        handler()
+        return True
+
+    def _build_key_handlers(self):
+        """ Build the key -> handler tables used by process_key_event """
+        term = self.term
+        explorer = self.explorer
+        stack = explorer.stack
+
+        def _ignore():
+            pass
 
-        elif key == "G" and self.explorer.stack.layout.visible:
-            self.explorer.stack.move_bottom()
+        # Stack ###############################################################
 
-        # disable these keys when the stack explorer is visible
-        elif (
-            key in ("l", "[", "]", "{", "}", "h") and self.explorer.stack.layout.visible
-        ):
-            return
+        self._stack_key_handlers: Dict[str, Callable[[], Any]] = {
+            " ": explorer.explore_selected_stack_object,
+            "j": stack.move_down,
+            "k": stack.move_up,
+            "g": stack.move_top,
+            "G": stack.move_bottom,
+            # disable these keys when the stack explorer is visible
+            "l": _ignore,
+            "[": _ignore,
+            "]": _ignore,
+            "{": _ignore,
+            "}": _ignore,
+            "h": _ignore,
+        }
+        self._stack_code_handlers: Dict[int, Callable[[], Any]] = {
+            term.KEY_BACKSPACE: self._hide_stack,
+            term.KEY_ESCAPE: self._hide_stack,
+            term.KEY_ENTER: explorer.explore_selected_stack_object,
+            term.KEY_DOWN: stack.move_down,
+            term.KEY_UP: stack.move_up,
+        }
 
         # Filter ##############################################################
 
-        elif key == "n":
-            if self.explorer.filter.layout.visible:
-                self.explorer.filter.layout.visible = False
-            elif self.explorer.stack.layout.visible:
-                self.explorer.stack.layout.visible = False
-                self.explorer.filter.layout.visible = True
-            else:
-                self.explorer.filter.layout.visible = True
-
-        elif key == "/" and not self.explorer.filter.receiving_input:
+        # explorer.filter is swapped out when exploring, so look it up on call
+        self._filter_key_handlers: Dict[str, Callable[[], Any]] = {
+            " ": self._toggle_filter,
+            "j": lambda: explorer.filter.move_down(),
+            "k": lambda: explorer.filter.move_up(),
+            "g": lambda: explorer.filter.move_top(),
+            "G": lambda: explorer.filter.move_bottom(),
+        }
+        self._filter_code_handlers: Dict[int, Callable[[], Any]] = {
+            term.KEY_ENTER: self._toggle_filter,
+            term.KEY_ESCAPE: self._hide_filter,
+            term.KEY_BACKSPACE: self._hide_filter,
+            term.KEY_DOWN: lambda: explorer.filter.move_down(),
+            term.KEY_UP: lambda: explorer.filter.move_up(),
+        }
+
+        # Explorer and overview ###############################################
+
+        self._key_handlers: Dict[str, Callable[[], Any]] = {
+            "o": self._toggle_stack_view,
+            "n": self._toggle_filter_view,
+            "/": self._start_search,
+            "c": self._clear_filters,
+            "k": explorer.move_up,
+            "j": explorer.move_down,
+            "l": explorer.explore_selected_object,
+            "h": self._explore_parent,
+            "g": explorer.move_top,
+            "G": explorer.move_bottom,
+            "[": self._switch_explorer_state,
+            "]": self._switch_explorer_state,
+            "+": explorer.increase_width,
+            "_": explorer.decrease_width,
+            "-": explorer.decrease_width,
+            "=": self._reset_width,
+            "{": self._switch_preview_state,
+            "}": self._switch_preview_state,
+            "d": self._toggle_docstring_view,
+            "p": self._toggle_value_view,
+            "f": self._fullscreen,
+            "O": self._open_in_editor,
+            "H": lambda: help(explorer.selected_object.obj),
+            "i": lambda: self._inspect(methods=True),
+            "I": lambda: self._inspect(all=True),
+        }
+        self._code_handlers: Dict[int, Callable[[], Any]] = {
+            term.KEY_UP: explorer.move_up,
+            term.KEY_DOWN: explorer.move_down,
+            term.KEY_ENTER: explorer.explore_selected_object,
+            term.KEY_RIGHT: explorer.explore_selected_object,
+            term.KEY_LEFT: self._explore_parent,
+        }
+
+    def _hide_stack(self):
+        self.explorer.stack.layout.visible = False
+
+    def _toggle_stack_view(self):
+        if self.explorer.stack.layout.visible:
             self.explorer.stack.layout.visible = False
-            self.explorer.filter.receiving_input = True
-            self.explorer.filter.layout.visible = True
-
-        elif (
-            key == " " or key.code == self.term.KEY_ENTER
-        ) and self.explorer.filter.layout.visible:
-            self.explorer.filter.toggle(self.explorer.cached_obj)
-            self.explorer.reset_index()
-
-        elif (
-            key.code in (self.term.KEY_ESCAPE, self.term.KEY_BACKSPACE)
-        ) and self.explorer.filter.layout.visible:
+        elif self.explorer.filter.layout.visible:
             self.explorer.filter.layout.visible = False
+            self.explorer.stack.set_visible()
+        else:
+            self.explorer.stack.set_visible()
 
-        elif (
-            key == "j" or key.code == self.term.KEY_DOWN
-        ) and self.explorer.filter.layout.visible:
-            self.explorer.filter.move_down()
-
-        elif (
-            key == "k" or key.code == self.term.KEY_CODE
-        ) and self.explorer.filter.layout.visible:
-            self.explorer.filter.move_up()
-
-        elif key == "g" and self.explorer.filter.layout.visible:
-            self.explorer.filter.move_top()
+    def _hide_filter(self):
+        self.explorer.filter.layout.visible = False
 
-        elif key == "G" and self.explorer.filter.layout.visible:
-            self.explorer.filter.move_bottom()
+    def _toggle_filter(self):
+        self.explorer.filter.toggle(self.explorer.cached_obj)
+        self.explorer.reset_index()
 
-        elif key == "c":
-            self.explorer.filter.clear_filters(self.explorer.cached_obj)
+    def _clear_filters(self):
+        self.explorer.filter.clear_filters(self.explorer.cached_obj)
+        # The index is left at -1 if the filters had hidden everything
+        self.explorer.reset_index()
 
-        # Explorer ############################################################
-
-        elif key == "k" or key.code == self.term.KEY_UP:
-            self.explorer.move_up()
-
-        elif key == "j" or key.code == self.term.KEY_DOWN:
-            self.explorer.move_down()
+    def _toggle_filter_view(self):
+        if self.explorer.filter.layout.visible:
+            self.explorer.filter.layout.visible = False
+        elif self.explorer.stack.layout.visible:
+            self.explorer.stack.layout.visible = False
+            self.explorer.filter.layout.visible = True
+        else:
+            self.explorer.filter.layout.visible = True
 
-        elif key in ("l") or key.code in (
-            self.term.KEY_ENTER,
-            self.term.KEY_RIGHT,
-            self.term.KEY,
-        ):
-            self.explorer.explore_selected_object()
+    def _start_search(self):
+        self.explorer.stack.layout.visible = False
+        self.explorer.filter.receiving_input = True
+        self.explorer.filter.layout.visible = True
 
+    def _explore_parent(self):
         # Go back to parent
-        elif (
-            key == "h" or key.code == self.term.KEY_LEFT
-        ) and self.explorer.stack.stack:
+        if self.explorer.stack.stack:
             self.explorer.explore_parent_obj()
 
-        elif key == "g":
-            self.explorer.move_top()
-
-        elif key == "G":
-            self.explorer.move_bottom()
-
+    def _switch_explorer_state(self):
         # Switch between public and private attributes
-        elif key in ("[", "]"):
-            if self.explorer.state == ExplorerState.public:
-                self.explorer.state = ExplorerState.private
+        if self.explorer.state == ExplorerState.public:
+            self.explorer.state = ExplorerState.private
 
-            elif self.explorer.state == ExplorerState.private:
-                self.explorer.state = ExplorerState.public
+        elif self.explorer.state == ExplorerState.private:
+            self.explorer.state = ExplorerState.public
 
-        elif key == "+":
-            self.explorer.increase_width()
+    def _reset_width(self):
+        self.explorer.extra_width = 0
 
-        elif key in ("_", "-"):
-            self.explorer.decrease_width()
+    def _switch_preview_state(self):
+        if not self.explorer.selected_object.is_callable:
+            return
 
-        elif key == "=":
-            self.explorer.extra_width = 0
+        if self.overview.preview_state == PreviewState.repr:
+            self.overview.preview_state = PreviewState.source
+        elif self.overview.preview_state == PreviewState.source:
+            self.overview.preview_state = PreviewState.repr
 
-        # Overview ############################################################
+    def _toggle_docstring_view(self):
+        self.overview.state = (
+            OverviewState.docstring
+            if self.overview.state != OverviewState.docstring
+            else OverviewState.all
+        )
 
-        elif key in ("{", "}"):
-            if not callable(self.explorer.selected_object.obj):
-                return
+    def _toggle_value_view(self):
+        self.overview.state = (
+            OverviewState.value
+            if self.overview.state != OverviewState.value
+            else OverviewState.all
+        )
 
-            if self.overview.preview_state == PreviewState.repr:
-                self.overview.preview_state = PreviewState.source
-            elif self.overview.preview_state == PreviewState.source:
-                self.overview.preview_state = PreviewState.repr
-
-        # Toggle docstring view
-        elif key == "d":
-            self.overview.state = (
-                OverviewState.docstring
-                if self.overview.state != OverviewState.docstring
-                else OverviewState.all
-            )
+    def _fullscreen(self):
+        printable: Union[str, Syntax, Text]
 
-        # Toggle value view
-        elif key == "p":
-            self.overview.state = (
-                OverviewState.value
-                if self.overview.state != OverviewState.value
-                else OverviewState.all
-            )
+        if self.overview.state == OverviewState.docstring:
+            printable = self.explorer.selected_object.docstring
 
-        # Fullscreen
-        elif key == "f":
-            printable: Union[str, Syntax, Text]
+        elif self.overview.preview_state == PreviewState.repr:
+            printable = self.explorer.selected_object.obj
 
-            if self.overview.state == OverviewState.docstring:
-                printable = self.explorer.selected_object.docstring
+        elif (
+            self.overview.preview_state == PreviewState.source
+            and self.explorer.selected_object._source
+        ):
+            printable = self.explorer.selected_object.get_source(fullscreen=True)
 
-            elif self.overview.preview_state == PreviewState.repr:
-                printable = self.explorer.selected_object.obj
+        else:
+            printable = self.explorer.selected_object.obj
 
-            elif (
-                self.overview.preview_state == PreviewState.source
-                and self.explorer.selected_object._source
-            ):
-                printable = self.explorer.selected_object.get_source(fullscreen=True)
+        with console.capture() as capture:
+            console.print(printable)
 
-            else:
-                printable = self.explorer.selected_object.obj
-
-            with console.capture() as capture:
-                console.print(printable)
-
-            str_out = capture.get()
-            pydoc.pager(str_out)
-
-        elif key == "O":
-            try:
-                path = inspect.getabsfile(self.explorer.selected_object.obj)
-                subprocess.call([EDITOR, path])  # type: ignore
-                # Re-hide the cursor
-                print("\x1b[?25l", end="")
-            except Exception:
-                self.error()
-
-        elif key == "H":
-            help(self.explorer.selected_object.obj)
-
-        elif key == "i":
-            with console.capture() as capture:
-                rich.inspect(
-                    self.explorer.selected_object.obj,
-                    console=console,
-                    methods=True,
-                )
-            str_out = capture.get()
-            pydoc.pager(str_out)
+        str_out = capture.get()
+        pydoc.pager(str_out)
 
-        elif key == "I":
-            with console.capture() as capture:
-                rich.inspect(
-                    self.explorer.selected_object.obj, console=console, all=True
-                )
-            str_out = capture.get()
-            pydoc.pager(str_out)
+    def _open_in_editor(self):
+        try:
+            path = inspect.getabsfile(self.explorer.selected_object.obj)
+            subprocess.call([EDITOR, path])  # type: ignore
+            # The source may have been edited
+            self.explorer.selected_object.refresh()
+            # Re-hide the cursor
+            print("\x1b[?25l", end="")
+        except Exception:
+            self.error()
+
+    def _inspect(self, **kwargs):
+        with console.capture() as capture:
+            rich.inspect(self.explorer.selected_object.obj, console=console, **kwargs)
+        str_out = capture.get()
+        pydoc.pager(str_out)
 
     def draw(self, *args):
         """ Draw the application. the *args argument is due to resize events and are unused """
         print(self.term.home, end="")
+        # Reading the terminal size is a syscall, only do it once per draw
+        term_height = self.term.height
         layout = Layout()
         layout.split_row(
             self.explorer.get_layout(),
-            self.overview.get_layout(self.explorer.selected_object),
+            self.overview.get_layout(self.explorer.selected_object, term_height),
         )
 
         title = (
@@ -399,7 +429,7 @@ class ObjExploreApp:
                 "[bright_blue][u]o[/u]:stack [/bright_blue][bright_magenta][u]n[/u]:filter [/bright_magenta][aquamarine1][u]/[/u]:search [/aquamarine1][u]r[/u]:return"
             ),
             subtitle_align="left",
-            height=self.term.height - 1,
+            height=term_height - 1,
             style=self.main_style,
         )
         rich.print(object_explorer, end="")
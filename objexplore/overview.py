@@ -1,4 +1,6 @@
-from typing import Union
+from collections import OrderedDict
+from enum import IntEnum
+from typing import Final, Optional, Tuple, Union
 
 from blessed import Terminal
 from rich.layout import Layout
@@ -6,146 +8,192 @@ from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.style import Style
 from rich.syntax import Syntax
-from rich.text import Text
 
 from .cached_object import CachedObject
 from .help_layout import HelpLayout
 
+_STYLE_WHITE = Style(color="white")
 
-class OverviewState:
-    all, docstring, value = range(3)
+_VALUE_TITLE = "[i]preview[/i] | [i][cyan]repr[/cyan]()[/i]"
+_VALUE_TITLE_REPR = _VALUE_TITLE + " [dim]source"
+_VALUE_TITLE_SOURCE = (
+    "[i]preview[/i] | [dim][cyan]repr[/cyan]()[/dim] [underline]source"
+)
+_VALUE_SUBTITLE = "[dim][u]p[/u]:toggle [u]f[/u]:fullscreen [u]{}[/u]:switch pane"
+_DOC_TITLE = "[i]docstring"
+_DOC_SUBTITLE_FULL = "[dim][u]d[/u]:toggle [u]f[/u]:fullscreen"
+_DOC_SUBTITLE = "[dim][u]d[/u]:toggle"
+_DOC_PANEL_CACHE_SIZE = 16
 
 
-class PreviewState:
-    repr, source = range(2)
+# Plain ints to compare the state against in the overview's own methods
+STATE_ALL: Final[int] = 0
+STATE_DOC: Final[int] = 1
+STATE_VALUE: Final[int] = 2
+
+
+class OverviewState(IntEnum):
+    all = STATE_ALL
+    docstring = STATE_DOC
+    value = STATE_VALUE
+
+
+class PreviewState(IntEnum):
+    repr = 0
+    source = 1
 
 
 class Overview:
+    __slots__ = (
+        "term",
+        "layout",
+        "value_panel",
+        "all_layout",
+        "help_layout",
+        "state",
+        "preview_state",
+        "_layout_key",
+        "_cached_layout",
+        "_doc_panels",
+        "_layout_builders",
+    )
+
     def __init__(self, term: Terminal, version: str):
         self.term = term
         self.layout = Layout()
+        # Only one value panel is shown at a time, its content is set by `get_value_panel`
+        self.value_panel = Panel(
+            "",
+            title_align="left",
+            subtitle=_VALUE_SUBTITLE,
+            subtitle_align="left",
+            style=_STYLE_WHITE,
+        )
+        # Split once, the panels are swapped in by `_build_all_layout`
+        self.all_layout = Layout()
+        self.all_layout.split_column(
+            Layout(name="obj_value"),
+            Layout(name="obj_info", size=3),
+            Layout(name="obj_doc"),
+        )
         self.help_layout = HelpLayout(version, visible=False, ratio=3)
         self.state = OverviewState.all
         self.preview_state = PreviewState.repr
+        # The last overview built and what it was built for
+        self._layout_key: Optional[Tuple[CachedObject, int, int, int, int]] = None
+        self._cached_layout: Optional[Layout] = None
+        # Docstring panels by (object, object version, terminal height, fullscreen),
+        # least recently used first
+        self._doc_panels: "OrderedDict[Tuple[CachedObject, int, int, bool], Panel]" = (
+            OrderedDict()
+        )
+        self._layout_builders = {
+            STATE_DOC: self._build_docstring_layout,
+            STATE_VALUE: self._build_value_layout,
+            STATE_ALL: self._build_all_layout,
+        }
 
     @property
     def layout_width(self):
         return (self.term.width - 2) // 4 * 3
 
-    def get_layout(self, cached_obj: CachedObject):
+    def get_layout(self, cached_obj: CachedObject, term_height: int):
         """
         :param cached_obj: The selected cached object given by the explorer layout
+        :param term_height: The height of the terminal, read once per draw
         """
         if self.help_layout.visible:
-            return self.help_layout(self.term.height)
-
-        elif self.state == OverviewState.docstring:
-            self.layout.update(
-                self.get_docstring_panel(
-                    cached_obj=cached_obj,
-                    term_height=self.term.height,
-                )
-            )
-            return self.layout
-
-        elif self.state == OverviewState.value:
-            self.layout.update(self.get_value_panel(cached_obj))
-            return self.layout
-
-        elif self.state == OverviewState.all:
-            layout = Layout()
-            layout.split_column(
-                Layout(self.get_value_panel(cached_obj)),
-                self.get_info_layout(cached_obj),
-                Layout(
-                    self.get_docstring_panel(
-                        cached_obj=cached_obj, term_height=self.term.height
-                    ),
-                ),
-            )
-            return layout
-
-    def get_value_panel(self, cached_obj: CachedObject):
-        renderable: Union[str, Pretty, Syntax]
-        if not callable(cached_obj.obj):
-            title = "[i]preview[/i] | [i][cyan]repr[/cyan]()[/i]"
-            subtitle = "[dim][u]p[/u]:toggle [u]f[/u]:fullscreen [u]{}[/u]:switch pane"
-            renderable = cached_obj.pretty
+            return self.help_layout(term_height)
+
+        if self.is_dirty(cached_obj, term_height):
+            build_layout = self._layout_builders[self.state]
+            self._cached_layout = build_layout(cached_obj, term_height)
+            self._layout_key = self._get_layout_key(cached_obj, term_height)
+        return self._cached_layout
+
+    def _get_layout_key(self, cached_obj: CachedObject, term_height: int):
+        return (
+            cached_obj,
+            cached_obj.version,
+            term_height,
+            self.state,
+            self.preview_state,
+        )
 
-            if self.state == OverviewState.all:
-                renderable.max_length = max((self.term.height - 6) // 2 - 7, 1)
-            else:
-                renderable.max_length = max(self.term.height - 9, 1)
+    def is_dirty(self, cached_obj: CachedObject, term_height: int) -> bool:
+        """Return whether `get_layout` has to build a new overview. Nothing in the overview
+        changes while the same object is selected in the same view and terminal height, so
+        the last layout is reused until one of them changes"""
+        return self._get_layout_key(cached_obj, term_height) != self._layout_key
 
-        else:
-            if self.preview_state == PreviewState.repr:
-                renderable = cached_obj.pretty
-                title = "[i]preview[/i] | [i][cyan]repr[/cyan]()[/i] [dim]source"
+    def _build_docstring_layout(self, cached_obj: CachedObject, term_height: int):
+        self.layout.update(
+            self.get_docstring_panel(cached_obj=cached_obj, term_height=term_height)
+        )
+        return self.layout
 
-            if self.preview_state == PreviewState.source:
-                renderable = cached_obj.get_source(self.term.height)
-                title = (
-                    "[i]preview[/i] | [dim][cyan]repr[/cyan]()[/dim] [underline]source"
-                )
+    def _build_value_layout(self, cached_obj: CachedObject, term_height: int):
+        self.layout.update(self.get_value_panel(cached_obj, term_height))
+        return self.layout
 
-            subtitle = "[dim][u]p[/u]:toggle [u]f[/u]:fullscreen [u]{}[/u]:switch pane"
+    def _build_all_layout(self, cached_obj: CachedObject, term_height: int):
+        self.all_layout["obj_value"].update(
+            self.get_value_panel(cached_obj, term_height)
+        )
+        self.all_layout["obj_info"].update(self.get_info_layout(cached_obj))
+        self.all_layout["obj_doc"].update(
+            self.get_docstring_panel(cached_obj=cached_obj, term_height=term_height)
+        )
+        return self.all_layout
 
-        return Panel(
-            renderable,
-            title=title,
-            title_align="left",
-            subtitle=subtitle,
-            subtitle_align="left",
-            style=Style(color="white"),
+    def get_value_panel(self, cached_obj: CachedObject, term_height: int):
+        renderable: Union[str, Pretty, Syntax]
+        # How many container items fit in the panel
+        max_length = (
+            (term_height - 6) // 2 - 7 if self.state == STATE_ALL else term_height - 9
         )
+        if max_length < 1:
+            max_length = 1
+
+        if not cached_obj.is_callable:
+            renderable = cached_obj.get_pretty(max_length)
+            title = _VALUE_TITLE
+        elif self.preview_state == PreviewState.source:
+            renderable = cached_obj.get_source(term_height)
+            title = _VALUE_TITLE_SOURCE
+        else:
+            renderable = cached_obj.pretty
+            title = _VALUE_TITLE_REPR
 
-    def get_info_layout(self, cached_obj: CachedObject):
-        if cached_obj.length is not None:
-            layout = Layout(size=3)
-            layout.split_row(
-                Layout(self.get_type_panel(cached_obj)),
-                Layout(
-                    Panel(
-                        str(cached_obj.length),
-                        title="[i][cyan]len[/cyan]()[/i]",
-                        title_align="left",
-                        style="white",
-                    )
-                ),
-            )
-            return layout
+        self.value_panel.renderable = renderable
+        self.value_panel.title = title
+        return self.value_panel
 
-        else:
-            return self.get_type_panel(cached_obj)
-
-    def get_type_panel(self, cached_obj: CachedObject):
-        return Layout(
-            Panel(
-                cached_obj.typeof,
-                title="[i][cyan]type[/cyan]()[/i]",
-                title_align="left",
-                style="white",
-            ),
-            size=3,
-        )
+    def get_info_layout(self, cached_obj: CachedObject) -> Layout:
+        return cached_obj.info_layout
 
     def get_docstring_panel(
         self,
         cached_obj: CachedObject,
         term_height: int,
     ) -> Panel:
-        """ Build the docstring panel """
-        title = "[i]docstring"
-        if self.state == OverviewState.docstring:
-            subtitle = "[dim][u]d[/u]:toggle [u]f[/u]:fullscreen"
-        else:
-            subtitle = "[dim][u]d[/u]:toggle"
-        docstring = Text("\n").join(cached_obj.docstring_lines[:term_height])
-        return Panel(
-            docstring,
-            title=title,
+        """ Build the docstring panel, reusing the one built for the same view """
+        fullscreen = self.state == STATE_DOC
+        key = (cached_obj, cached_obj.version, term_height, fullscreen)
+        panel = self._doc_panels.get(key)
+        if panel is not None:
+            self._doc_panels.move_to_end(key)
+            return panel
+
+        panel = Panel(
+            cached_obj.get_docstring(term_height),
+            title=_DOC_TITLE,
             title_align="left",
-            subtitle=subtitle,
+            subtitle=_DOC_SUBTITLE_FULL if fullscreen else _DOC_SUBTITLE,
             subtitle_align="left",
-            style="white",
+            style=_STYLE_WHITE,
         )
+        self._doc_panels[key] = panel
+        if len(self._doc_panels) > _DOC_PANEL_CACHE_SIZE:
+            self._doc_panels.popitem(last=False)
+        return panel
@@ -22,10 +22,10 @@ setup(
     license="",
     classifiers=[
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
     ],
+    python_requires=">=3.8",
     packages=["objexplore"],
     include_package_data=True,
     install_requires=["blessed==1.17.12", "rich==10.9.0"],
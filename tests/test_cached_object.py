@@ -0,0 +1,129 @@
+from collections import OrderedDict, deque
+
+from objexplore.cached_object import _MAX_FILTERED_ITEMS, CachedObject, _short_repr
+
+
+class Example:
+    an_int = 1
+    a_str = "string"
+    _private = None
+
+
+def test_attributes_are_cached_on_demand():
+    cached_obj = CachedObject(Example(), attr_name="example")
+    cached_obj.cache()
+
+    assert cached_obj.filtered_public_attributes == ["a_str", "an_int"]
+    assert "_private" in cached_obj.filtered_private_attributes
+    assert not cached_obj.public_attributes
+
+    assert cached_obj.public_attributes["an_int"].obj == 1
+    assert list(cached_obj.public_attributes) == ["an_int"]
+
+
+def test_container_subclasses_are_explored_as_containers():
+    cached_obj = CachedObject(OrderedDict(a=1, b=2), attr_name="ordered")
+    cached_obj.cache()
+    assert list(cached_obj.filtered_dict) == ["a", "b"]
+    assert cached_obj.text.plain == "{**ordered}"
+
+    cached_obj = CachedObject(deque([1, 2, 3]), attr_name="queue")
+    cached_obj.cache()
+    assert [entry.obj for _, entry in cached_obj.filtered_list] == [1, 2, 3]
+    assert cached_obj.text.plain == "[*queue]"
+
+    cached_obj = CachedObject("string", attr_name="string")
+    cached_obj.cache()
+    assert not cached_obj.filtered_list
+
+
+class Raises:
+    @property
+    def broken(self):
+        raise RuntimeError
+
+
+def test_attributes_that_raise_are_skipped():
+    cached_obj = CachedObject(Raises(), attr_name="raises")
+    cached_obj.cache()
+    assert "broken" not in cached_obj.filtered_public_attributes
+
+
+def test_long_sequences_are_indexed_lazily():
+    cached_obj = CachedObject(range(10 ** 9), attr_name="huge")
+    cached_obj.cache()
+    assert len(cached_obj.filtered_list) == 10 ** 9
+    assert cached_obj.filtered_list[5][1].obj == 5
+    assert cached_obj.filtered_list[-1][1].obj == 10 ** 9 - 1
+    assert [entry.obj for _, entry in cached_obj.filtered_list[3:6]] == [3, 4, 5]
+
+
+def test_filtering_checks_every_item_of_long_lists():
+    def is_even(entry):
+        return isinstance(entry.obj, int) and entry.obj % 2 == 0
+
+    cached_obj = CachedObject(list(range(15_000)), attr_name="items")
+    cached_obj.cache()
+    cached_obj.set_filters([is_even])
+    assert cached_obj.num_filtered_list_items == 7_500
+
+    # `range` items are computed on demand, only the first ones are filtered
+    cached_obj = CachedObject(range(10 ** 9), attr_name="huge")
+    cached_obj.cache()
+    cached_obj.set_filters([is_even])
+    assert cached_obj.num_filtered_list_items == _MAX_FILTERED_ITEMS // 2
+
+
+def test_refresh_rebuilds_the_overview_views():
+    items = [1, 2]
+    cached_obj = CachedObject(items, attr_name="items")
+    assert cached_obj.length == 2
+
+    items.append(3)
+    cached_obj.refresh()
+    assert cached_obj.length == 3
+    assert cached_obj.version == 1
+
+
+def test_source_that_no_longer_parses_is_unavailable(tmp_path, monkeypatch):
+    (tmp_path / "edited_module.py").write_text("def func():\n    return 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import edited_module
+
+    cached_obj = CachedObject(edited_module.func, attr_name="func")
+    assert cached_obj._source
+
+    (tmp_path / "edited_module.py").write_text("def func(:\n    return (1\n")
+    cached_obj.refresh()
+    assert cached_obj.get_source(10) == "[red italic]Source code unavailable"
+
+
+def test_repr_keeps_dict_insertion_order():
+    mapping = {"zeta": 1, "alpha": 2, "mid": 3}
+    assert CachedObject(mapping, attr_name="mapping").repr.plain == repr(mapping)
+
+
+def test_repr_does_not_need_repr_fillvalue(monkeypatch):
+    # `reprlib.Repr` has no `fillvalue` before Python 3.11
+    monkeypatch.delattr(_short_repr, "fillvalue", raising=False)
+    mapping = {i: i for i in range(20)}
+    assert CachedObject(mapping, attr_name="mapping").repr.plain.endswith(", ...}")
+
+
+def test_attributes_are_looked_up_once():
+    class Counting:
+        calls = 0
+
+        @property
+        def counted(self):
+            Counting.calls += 1
+            return Counting.calls
+
+        @property
+        def raising(self):
+            raise RuntimeError
+
+    cached_obj = CachedObject(Counting(), attr_name="counting")
+    cached_obj.cache()
+    assert Counting.calls == 1
+    assert "raising" not in cached_obj.filtered_public_attributes